@@ -8,18 +8,25 @@ application and command-line scripts.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Iterable, List, Sequence
-import json
+from typing import Dict, Iterable, List, Mapping, Sequence
+import sys
+
+import msgspec
+from msgspec.structs import replace
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ISSUES_FILE = BASE_DIR / 'data' / 'git_issues.json'
 
 
-@dataclass
-class Issue:
-    """Representation of a Git issue entry."""
+class Issue(msgspec.Struct, forbid_unknown_fields=True):
+    """Representation of a Git issue entry.
+
+    ``status`` is lowercased and interned on creation so that status
+    comparisons stay cheap. Assigning ``status`` afterwards bypasses that
+    normalization: the new value must already be lowercase (``'open'``,
+    ``'closed'``), otherwise :attr:`is_open` reports ``False``.
+    """
 
     id: int
     title: str
@@ -29,11 +36,17 @@ class Issue:
     notes: str | None = None
     priority: str | None = None
 
+    def __post_init__(self) -> None:
+        self.status = sys.intern(self.status.lower())
+
     @property
     def is_open(self) -> bool:
-        """Return ``True`` when the issue is still open."""
+        """Return ``True`` when the issue is still open.
+
+        ``status`` is compared as-is; see the class docstring.
+        """
 
-        return self.status.lower() == 'open'
+        return self.status == 'open'
 
     def close(self, note: str | None = None) -> None:
         """Mark the issue as closed and optionally append a note."""
@@ -44,6 +57,10 @@ class Issue:
             self.notes = note
 
 
+_decoder = msgspec.json.Decoder(List[Issue])
+_encoder = msgspec.json.Encoder()
+
+
 def load_issues(path: Path = ISSUES_FILE) -> List[Issue]:
     """Load issues from ``path``.
 
@@ -53,17 +70,13 @@ def load_issues(path: Path = ISSUES_FILE) -> List[Issue]:
         Path to the JSON file storing the issues list.
     """
 
-    with path.open('r', encoding='utf-8') as handle:
-        payload = json.load(handle)
-    return [Issue(**item) for item in payload]
+    return _decoder.decode(path.read_bytes())
 
 
 def save_issues(issues: Sequence[Issue], path: Path = ISSUES_FILE) -> None:
     """Persist ``issues`` into ``path`` in JSON format."""
 
-    serializable = [asdict(issue) for issue in issues]
-    with path.open('w', encoding='utf-8') as handle:
-        json.dump(serializable, handle, indent=2, ensure_ascii=False)
+    path.write_bytes(msgspec.json.format(_encoder.encode(issues), indent=2))
 
 
 def list_open_issues(issues: Iterable[Issue]) -> List[Issue]:
@@ -76,45 +89,100 @@ def close_implemented_issues(issues: Sequence[Issue]) -> List[Issue]:
     """Close every issue that is already implemented.
 
     The function mutates a shallow copy of ``issues`` to avoid side
-    effects when the caller still needs the original list.
+    effects when the caller still needs the original list. When no issue
+    needs closing, the entries are returned as-is without being copied.
     """
 
-    updated = [Issue(**asdict(issue)) for issue in issues]
-    for issue in updated:
-        if issue.implemented and issue.is_open:
-            issue.close(note='Automatically closed because implementation exists.')
+    to_close = [
+        position
+        for position, issue in enumerate(issues)
+        if issue.implemented and issue.is_open
+    ]
+    if not to_close:
+        return list(issues)
+
+    updated = [replace(issue) for issue in issues]
+    for position in to_close:
+        updated[position].close(
+            note='Automatically closed because implementation exists.'
+        )
     return updated
 
 
-def complete_issue(issues: Sequence[Issue], issue_id: int, note: str | None = None) -> List[Issue]:
+def build_index(issues: Sequence[Issue]) -> Dict[int, int]:
+    """Map every issue id to its position in ``issues``.
+
+    When an id appears several times, its first position wins, matching
+    the linear scan in :func:`complete_issue`. The lists returned by
+    :func:`complete_issue` keep the same order, so an index built once
+    stays valid across successive calls.
+    """
+
+    index: Dict[int, int] = {}
+    for position, issue in enumerate(issues):
+        index.setdefault(issue.id, position)
+    return index
+
+
+def _find_issue(issues: Sequence[Issue], issue_id: int) -> int:
+    """Return the position of the first issue identified by ``issue_id``."""
+
+    for position, issue in enumerate(issues):
+        if issue.id == issue_id:
+            return position
+    raise ValueError(f'Issue {issue_id} not found')
+
+
+def complete_issue(
+    issues: Sequence[Issue],
+    issue_id: int,
+    note: str | None = None,
+    index: Mapping[int, int] | None = None,
+) -> List[Issue]:
     """Mark the issue identified by ``issue_id`` as completed.
 
     The function returns a new list where the targeted issue is updated.
+    Entries are only copied when the targeted issue actually changes.
+    Pass an ``index`` from :func:`build_index` to avoid scanning ``issues``
+    when completing several issues in a row; an index that does not match
+    ``issues`` falls back to the scan.
     """
 
-    updated = [Issue(**asdict(issue)) for issue in issues]
-    for issue in updated:
-        if issue.id == issue_id:
-            issue.close(note=note)
-            break
-    else:  # pragma: no cover - defensive branch
-        raise ValueError(f'Issue {issue_id} not found')
+    position = index.get(issue_id) if index is not None else None
+    if (
+        position is None
+        or position >= len(issues)
+        or issues[position].id != issue_id
+    ):
+        position = _find_issue(issues, issue_id)
+    target = issues[position]
+
+    if (
+        target.status == 'closed'
+        and target.implemented
+        and (not note or target.notes == note)
+    ):
+        return list(issues)
+
+    updated = [replace(issue) for issue in issues]
+    updated[position].close(note=note)
     return updated
 
 
 def summarize_open_issues(issues: Sequence[Issue]) -> str:
     """Produce a human readable summary of open issues."""
 
-    open_issues = list_open_issues(issues)
-    if not open_issues:
-        return 'No open issues 🎉'
-
     lines = ['Open issues:']
-    for issue in open_issues:
-        parts = [f"#{issue.id}", issue.title]
+    for issue in issues:
+        if not issue.is_open:
+            continue
         if issue.priority:
-            parts.append(f'[{issue.priority}]')
-        lines.append(' - ' + ' '.join(parts))
+            lines.append(f' - #{issue.id} {issue.title} [{issue.priority}]')
+        else:
+            lines.append(f' - #{issue.id} {issue.title}')
+
+    if len(lines) == 1:
+        return 'No open issues 🎉'
     return '\n'.join(lines)
 
 
@@ -2,39 +2,176 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import os
+import re
+import sys
+from functools import lru_cache, partial
 from pathlib import Path
-from flask import Flask, jsonify
-from flask_cors import CORS
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+import orjson
+from flask import Flask, Response, request
+from werkzeug.routing import BaseConverter, Map
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 TRANSLATIONS_FILE = BASE_DIR / 'data' / 'translations.json'
 
 
-def load_translations() -> dict[str, dict[str, str]]:
-    """Load translations from the JSON file shipped with the project."""
+def ojson(payload: object, status: int = 200) -> Response:
+    """Serialize ``payload`` with orjson into a JSON :class:`Response`."""
+
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+
+class LocaleConverter(BaseConverter):
+    """URL converter matching only the given ``locales``.
+
+    Its lower weight makes Werkzeug try it before the plain ``<locale>``
+    fallback rules, which only see unknown locales.
+    """
+
+    weight = 50
+
+    def __init__(self, url_map: Map, locales: Iterable[str]) -> None:
+        super().__init__(url_map)
+        self.regex = '|'.join(map(re.escape, locales)) or '(?!)'
+
+
+def prebuilt_body(payload: object) -> tuple[bytes, str]:
+    """Serialize ``payload`` once and return it with its ETag."""
+
+    body = orjson.dumps(payload)
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def cached_response(body: bytes, etag: str) -> Response:
+    """Serve a prebuilt ``body``, answering 304 when the client has it."""
+
+    # If-None-Match uses weak comparison (RFC 7232 §3.2): proxies that
+    # compress responses rewrite the ETag as ``W/"..."``
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+
+@lru_cache(maxsize=4)
+def _load_translations_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Mapping[str, Mapping[str, str]]:
+    """Parse the translations file once per ``(path, mtime, size)`` version.
+
+    Keys and values are interned: locales share most keys and often fall
+    back to identical values, so each distinct string is stored only once.
+    Both levels are wrapped in :class:`types.MappingProxyType` because the
+    result is shared by every application built from this file version.
+    """
+
+    translations = orjson.loads(Path(path_str).read_bytes())
+    return MappingProxyType({
+        sys.intern(locale): MappingProxyType({
+            sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+            for key, value in data.items()
+        })
+        for locale, data in translations.items()
+    })
+
+
+def load_translations() -> Mapping[str, Mapping[str, str]]:
+    """Load translations from the JSON file shipped with the project.
+
+    The parsed payload is cached until the file changes on disk, so every
+    application created in the same interpreter shares a single read-only
+    mapping.
+    """
 
     if not TRANSLATIONS_FILE.exists():  # pragma: no cover - guardrail
         raise FileNotFoundError(f'Translations file missing at {TRANSLATIONS_FILE}')
 
-    with TRANSLATIONS_FILE.open('r', encoding='utf-8') as handle:
-        return json.load(handle)
+    stat = TRANSLATIONS_FILE.stat()
+    return _load_translations_cached(
+        str(TRANSLATIONS_FILE), stat.st_mtime_ns, stat.st_size
+    )
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
-    CORS(app)
 
     # Configuration
     app.config['DEBUG'] = os.getenv('FLASK_DEBUG', '0') == '1'
-    app.config['TRANSLATIONS'] = load_translations()
+    translations = load_translations()
+    app.config['TRANSLATIONS'] = translations
+
+    # Translations never change once loaded: precompute what handlers need.
+    # Views close over these locals instead of reading app.config per request.
+    locales_sorted = sorted(translations.keys())
+    locale_counts = {locale: len(data) for locale, data in translations.items()}
+    locales_body = prebuilt_body({
+        'success': True,
+        'data': {
+            'locales': locales_sorted
+        },
+        'message': 'Locales disponibles récupérées',
+        'error': None,
+        'meta': {
+            'count': len(locales_sorted)
+        }
+    })
+    locale_bodies = {
+        locale: prebuilt_body({
+            'success': True,
+            'data': {
+                'locale': locale,
+                # orjson cannot serialize mappingproxy objects
+                'translations': dict(data)
+            },
+            'message': 'Traductions récupérées',
+            'error': None,
+            'meta': {
+                'count': locale_counts[locale]
+            }
+        })
+        for locale, data in translations.items()
+    }
+    app.config['LOCALES_SORTED'] = locales_sorted
+    app.config['LOCALE_COUNTS'] = locale_counts
+    app.config['LOCALES_BODY'] = locales_body
+    app.config['LOCALE_BODIES'] = locale_bodies
+    app.url_map.converters['loc'] = partial(LocaleConverter, locales=locales_sorted)
+
+    def locale_not_found(locale: str, key: str | None = None) -> Response:
+        # The message embeds the requested locale, so it cannot be prebuilt
+        return ojson({
+            'success': False,
+            'data': None,
+            'message': f'Locale "{locale}" inconnue',
+            'error': 'locale_not_found',
+            'meta': None
+        }, 404)
+
+    @app.after_request
+    def add_cors_headers(response: Response) -> Response:
+        # Every endpoint is public and read-only: allow any origin. Flask also
+        # runs after_request hooks on the 500 response built for unhandled
+        # exceptions, so browsers still see the real server error.
+        response.headers['Access-Control-Allow-Origin'] = '*'
+        if request.method == 'OPTIONS':
+            response.headers['Access-Control-Allow-Methods'] = 'GET, HEAD, OPTIONS'
+            requested = request.headers.get('Access-Control-Request-Headers')
+            if requested:
+                response.headers['Access-Control-Allow-Headers'] = requested
+        return response
 
     # Health check endpoint
     @app.route('/health')
     def health():
-        return jsonify({
+        return ojson({
             'success': True,
             'data': {
                 'status': 'healthy',
@@ -43,74 +180,33 @@ def create_app() -> Flask:
             'message': 'Service en bonne santé',
             'error': None,
             'meta': None
-        }), 200
+        }, 200)
 
     @app.route('/locales')
     def locales():
-        translations = app.config['TRANSLATIONS']
-        locales_list = sorted(translations.keys())
-        return jsonify({
-            'success': True,
-            'data': {
-                'locales': locales_list
-            },
-            'message': 'Locales disponibles récupérées',
-            'error': None,
-            'meta': {
-                'count': len(locales_list)
-            }
-        }), 200
+        return cached_response(*locales_body)
 
-    @app.route('/translations/<locale>')
-    def translations_for_locale(locale: str):
-        translations = app.config['TRANSLATIONS']
-        locale_data = translations.get(locale)
-        if locale_data is None:
-            return jsonify({
-                'success': False,
-                'data': None,
-                'message': f'Locale "{locale}" inconnue',
-                'error': 'locale_not_found',
-                'meta': None
-            }), 404
+    # Unknown locales fall through the ``loc`` converter to these rules
+    app.add_url_rule('/translations/<locale>', view_func=locale_not_found)
+    app.add_url_rule('/translations/<locale>/<key>', view_func=locale_not_found)
 
-        return jsonify({
-            'success': True,
-            'data': {
-                'locale': locale,
-                'translations': locale_data
-            },
-            'message': 'Traductions récupérées',
-            'error': None,
-            'meta': {
-                'count': len(locale_data)
-            }
-        }), 200
+    @app.route('/translations/<loc:locale>')
+    def translations_for_locale(locale: str):
+        return cached_response(*locale_bodies[locale])
 
-    @app.route('/translations/<locale>/<key>')
+    @app.route('/translations/<loc:locale>/<key>')
     def translation_by_key(locale: str, key: str):
-        translations = app.config['TRANSLATIONS']
-        locale_data = translations.get(locale)
-        if locale_data is None:
-            return jsonify({
-                'success': False,
-                'data': None,
-                'message': f'Locale "{locale}" inconnue',
-                'error': 'locale_not_found',
-                'meta': None
-            }), 404
-
-        value = locale_data.get(key)
+        value = translations[locale].get(key)
         if value is None:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'data': None,
                 'message': f'Clé "{key}" introuvable pour la locale {locale}',
                 'error': 'key_not_found',
                 'meta': None
-            }), 404
+            }, 404)
 
-        return jsonify({
+        return ojson({
             'success': True,
             'data': {
                 'locale': locale,
@@ -120,12 +216,13 @@ def create_app() -> Flask:
             'message': 'Traduction récupérée',
             'error': None,
             'meta': None
-        }), 200
+        }, 200)
 
     return app
 
 
-if __name__ == '__main__':
+if __name__ == '__main__':  # pragma: no cover - development server only
+    # Production deployments go through gunicorn and :mod:`src.wsgi`
     app = create_app()
     port = int(os.getenv('PORT', '5007'))
     app.run(host='0.0.0.0', port=port, debug=True)
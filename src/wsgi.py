@@ -0,0 +1,11 @@
+"""WSGI entry point for production servers.
+
+Run with ``gunicorn --preload -k gthread -w <workers> src.wsgi:app``.
+``--preload`` builds the application, including the parsed translations
+and prebuilt response bodies, once in the master process; forked workers
+then share that memory copy-on-write.
+"""
+
+from src.main import create_app
+
+app = create_app()
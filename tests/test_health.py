@@ -12,3 +12,32 @@ def test_health_endpoint(client):
     assert data['data']['status'] == 'healthy'
     assert data['data']['service'] == 'umbra-localization-service'
     assert 'Service en bonne santé' in data['message']
+
+
+def test_cors_headers(client):
+    """Test des en-têtes CORS, y compris pour les requêtes preflight."""
+    response = client.get('/health')
+    assert response.headers['Access-Control-Allow-Origin'] == '*'
+
+    preflight = client.options('/locales', headers={
+        'Origin': 'http://localhost:3000',
+        'Access-Control-Request-Method': 'GET',
+        'Access-Control-Request-Headers': 'If-None-Match'
+    })
+    assert preflight.status_code == 200
+    assert preflight.headers['Access-Control-Allow-Origin'] == '*'
+    assert 'GET' in preflight.headers['Access-Control-Allow-Methods']
+    assert preflight.headers['Access-Control-Allow-Headers'] == 'If-None-Match'
+
+
+def test_cors_headers_on_server_error(app):
+    """Les erreurs 500 non gérées conservent l'en-tête CORS."""
+    app.config['PROPAGATE_EXCEPTIONS'] = False
+
+    @app.route('/boom')
+    def boom():
+        raise RuntimeError('boom')
+
+    response = app.test_client().get('/boom')
+    assert response.status_code == 500
+    assert response.headers['Access-Control-Allow-Origin'] == '*'
@@ -3,11 +3,13 @@ from pathlib import Path
 
 import json
 
+import msgspec
 import pytest
 
 from src import issues as issues_module
 from src.issues import (
     Issue,
+    build_index,
     close_implemented_issues,
     complete_issue,
     list_open_issues,
@@ -80,3 +82,87 @@ def test_save_and_load_roundtrip(tmp_path: Path, sample_issues):
     assert [(issue.id, issue.status) for issue in reloaded] == [
         (issue.id, issue.status) for issue in sample_issues
     ]
+
+
+def test_close_implemented_issues_without_work_keeps_entries(sample_issues):
+    closed = close_implemented_issues(sample_issues)
+    again = close_implemented_issues(closed)
+    assert again == closed
+    assert all(left is right for left, right in zip(again, closed))
+
+
+def test_complete_issue_on_closed_issue_keeps_entries(sample_issues):
+    closed = complete_issue(sample_issues, issue_id=2, note='Done')
+    again = complete_issue(closed, issue_id=2, note='Done')
+    assert all(left is right for left, right in zip(again, closed))
+
+
+def test_load_issues_normalizes_status(tmp_path: Path):
+    issues_path = tmp_path / 'mixed.json'
+    issues_path.write_text(
+        json.dumps([
+            {'id': 3, 'title': 'Uppercase', 'status': 'OPEN', 'implemented': False}
+        ]),
+        encoding='utf-8',
+    )
+    loaded = load_issues(issues_path)
+    assert loaded[0].status == 'open'
+    assert list_open_issues(loaded) == loaded
+
+
+def test_issue_normalizes_status_on_creation():
+    issue = Issue(1, 'Built in code', 'OPEN', False)
+    assert issue.status == 'open'
+    assert issue.is_open
+
+
+def test_summarize_open_issues_lists_entries(sample_issues):
+    summary = summarize_open_issues(sample_issues)
+    assert summary == (
+        'Open issues:\n'
+        ' - #1 Already implemented feature [P1]\n'
+        ' - #2 Missing functionality [P2]'
+    )
+
+
+def test_complete_issue_with_index(sample_issues):
+    index = build_index(sample_issues)
+    updated = complete_issue(sample_issues, issue_id=1, index=index)
+    updated = complete_issue(updated, issue_id=2, note='Batch', index=index)
+    assert [issue.status for issue in updated] == ['closed', 'closed']
+    assert updated[1].notes == 'Batch'
+
+    with pytest.raises(ValueError):
+        complete_issue(updated, issue_id=99, index=index)
+
+
+def test_complete_issue_with_index_from_other_list(sample_issues):
+    index = build_index([Issue(0, 'Dropped', 'open', False), *sample_issues])
+    updated = complete_issue(sample_issues, issue_id=1, index=index)
+    assert [(issue.id, issue.status) for issue in updated] == [
+        (1, 'closed'),
+        (2, 'open'),
+    ]
+
+
+def test_build_index_keeps_first_duplicate():
+    issues = [Issue(7, 'First', 'open', False), Issue(7, 'Second', 'open', False)]
+    assert build_index(issues) == {7: 0}
+
+    by_index = complete_issue(issues, issue_id=7, index=build_index(issues))
+    by_scan = complete_issue(issues, issue_id=7)
+    assert [issue.status for issue in by_index] == ['closed', 'open']
+    assert by_index == by_scan
+
+
+def test_load_issues_rejects_unknown_fields(tmp_path: Path):
+    issues_path = tmp_path / 'extra.json'
+    issues_path.write_text(
+        json.dumps([
+            {'id': 4, 'title': 'Extra', 'status': 'open', 'implemented': False,
+             'labels': ['bug']}
+        ]),
+        encoding='utf-8',
+    )
+    with pytest.raises(msgspec.ValidationError):
+        load_issues(issues_path)
@@ -1,4 +1,8 @@
 """Tests for translation related endpoints."""
+import pytest
+
+from src import main as main_module
+
 
 def test_list_locales_endpoint(client):
     response = client.get('/locales')
@@ -45,3 +49,73 @@ def test_translation_by_key_missing_key(client):
 
     data = response.get_json()
     assert data['error'] == 'key_not_found'
+
+
+def test_translations_for_locale_reports_count(client):
+    response = client.get('/translations/fr')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+
+    data = response.get_json()
+    assert data['meta']['count'] == len(data['data']['translations'])
+
+
+def test_translations_for_locale_sets_etag(client):
+    response = client.get('/translations/en')
+    assert response.status_code == 200
+    assert response.headers['ETag']
+    assert 'max-age' in response.headers['Cache-Control']
+
+    cached = client.get(
+        '/translations/en', headers={'If-None-Match': response.headers['ETag']}
+    )
+    assert cached.status_code == 304
+    assert cached.data == b''
+    assert cached.headers['ETag'] == response.headers['ETag']
+
+
+def test_list_locales_honours_if_none_match(client):
+    etag = client.get('/locales').headers['ETag']
+    fresh = client.get('/locales', headers={'If-None-Match': etag})
+    stale = client.get('/locales', headers={'If-None-Match': '"stale"'})
+    assert fresh.status_code == 304
+    assert stale.status_code == 200
+
+
+def test_translations_for_locale_prefix_is_unknown(client):
+    response = client.get('/translations/enx/greeting')
+    assert response.status_code == 404
+
+    data = response.get_json()
+    assert data['error'] == 'locale_not_found'
+
+
+def test_translations_for_locale_accepts_weak_etag(client):
+    etag = client.get('/translations/en').headers['ETag']
+    response = client.get('/translations/en', headers={'If-None-Match': f'W/{etag}'})
+    assert response.status_code == 304
+
+
+def test_load_translations_is_cached_per_file_version(tmp_path, monkeypatch):
+    translations_path = tmp_path / 'translations.json'
+    translations_path.write_text('{"en": {"greeting": "Hello"}}', encoding='utf-8')
+    monkeypatch.setattr(main_module, 'TRANSLATIONS_FILE', translations_path)
+
+    first = main_module.load_translations()
+    assert main_module.load_translations() is first
+
+    translations_path.write_text(
+        '{"en": {"greeting": "Hello"}, "de": {"greeting": "Hallo"}}',
+        encoding='utf-8',
+    )
+    reloaded = main_module.load_translations()
+    assert reloaded is not first
+    assert reloaded['de']['greeting'] == 'Hallo'
+
+
+def test_load_translations_is_read_only():
+    translations = main_module.load_translations()
+    with pytest.raises(TypeError):
+        translations['en']['greeting'] = 'Hi'
+    with pytest.raises(TypeError):
+        translations['it'] = {}